@@ -1,15 +1,30 @@
+import ast
+import functools
+import logging
+import mmap
+import os
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import yaml
-from loguru import logger
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Config files larger than this are memory-mapped instead of read through
+_MMAP_THRESHOLD = 1024
+
+logger = logging.getLogger(__name__)
 
 
 class GameConfig(BaseModel):
     """Configuration for the game - easily adjustable"""
 
+    # Frozen so a single cached instance can be shared safely
+    model_config = ConfigDict(frozen=True)
+
     rows: int = Field(
         default=6, ge=4, le=10, description="Number of rows in the game board"
     )
@@ -19,6 +34,11 @@ class GameConfig(BaseModel):
     win_length: int = Field(
         default=4, ge=3, le=8, description="Number of consecutive pieces needed to win"
     )
+    animate: Optional[bool] = Field(
+        default=None,
+        description="Pause while the AI is thinking; defaults to on only when "
+        "output goes to a terminal",
+    )
 
     @field_validator("win_length")
     @classmethod
@@ -34,6 +54,19 @@ class GameConfig(BaseModel):
                 )
         return v
 
+    @classmethod
+    def from_trusted(cls, data: Optional[Dict[str, Any]] = None) -> "GameConfig":
+        """
+        Build a configuration without running validators.
+
+        Only use this for values that are already known to be valid, such as
+        the built-in defaults. Missing fields fall back to their defaults.
+        """
+        return cls.model_construct(**(data or {}))
+
+
+DEFAULT_CONFIG = GameConfig.from_trusted()
+
 
 def load_config_from_yaml(config_path: Union[str, Path]) -> GameConfig:
     """
@@ -56,8 +89,12 @@ def load_config_from_yaml(config_path: Union[str, Path]) -> GameConfig:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     try:
-        with open(config_path, "r", encoding="utf-8") as file:
-            config_data = yaml.safe_load(file)
+        with open(config_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size > _MMAP_THRESHOLD:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    config_data = yaml.load(mapped, Loader=_YAML_LOADER)
+            else:
+                config_data = yaml.load(file, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Error parsing YAML file {config_path}: {e}")
 
@@ -78,7 +115,58 @@ def get_config(config_path: Optional[Union[str, Path]] = None) -> GameConfig:
         GameConfig: Game configuration
     """
     if config_path:
-        return load_config_from_yaml(config_path)
+        return _load_cached_config(str(config_path))
 
     logger.info("No configuration file found, using default configuration")
-    return GameConfig()
+    return DEFAULT_CONFIG
+
+
+def compiled_config_path(config_path: Union[str, Path]) -> Path:
+    """Get the path of the compiled form of a YAML config file"""
+    config_path = Path(config_path)
+    return config_path.with_name(f"{config_path.stem}_compiled.py")
+
+
+def load_compiled_config(config_path: Union[str, Path]) -> Optional[GameConfig]:
+    """
+    Load a configuration compiled by tools/compile_config.py.
+
+    The compiled file holds a single Python literal that is read back with
+    ast.literal_eval, so it is never imported or executed. Its values are
+    trusted as-is, without running validators.
+
+    Args:
+        config_path: Path to the YAML configuration file it was compiled from
+
+    Returns:
+        Optional[GameConfig]: The compiled configuration, or None if there is
+        no compiled file, it is older than the YAML file or it can't be read
+    """
+    config_path = Path(config_path)
+    compiled_path = compiled_config_path(config_path)
+
+    try:
+        if compiled_path.stat().st_mtime < config_path.stat().st_mtime:
+            return None
+        config_data = ast.literal_eval(compiled_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, SyntaxError, TypeError, ValueError) as e:
+        logger.warning(f"Ignoring compiled configuration {compiled_path}: {e}")
+        return None
+
+    if not isinstance(config_data, dict):
+        logger.warning(f"Ignoring compiled configuration {compiled_path}: not a dict")
+        return None
+
+    return GameConfig.from_trusted(config_data)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached_config(config_path: str) -> GameConfig:
+    """Load a configuration file once per path, preferring its compiled form"""
+    compiled_config = load_compiled_config(config_path)
+    if compiled_config is not None:
+        return compiled_config
+
+    return load_config_from_yaml(config_path)
@@ -1,11 +1,12 @@
 import sys
+import logging
 import argparse
 
-from loguru import logger
-
 from config import get_config, GameConfig
 from src.engine import GameEngine
 
+logger = logging.getLogger(__name__)
+
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments"""
@@ -26,6 +27,11 @@ def parse_arguments() -> argparse.Namespace:
 
 def main():
     """Main entry point"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)-8s | %(message)s"
+    )
+
     try:
         args = parse_arguments()
         
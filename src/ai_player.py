@@ -5,16 +5,18 @@ Simple (Really dumb actually :) ) AI player with basic strategy
 
 import random
 from typing import List, Optional
-from src.enums import Player, GameState
+from config import GameConfig
+from src.enums import Player
 from src.board import GameBoard
 
 
 class AIPlayer:
     """Simple AI player with basic strategy"""
     
-    def __init__(self, player: Player):
+    def __init__(self, player: Player, config: GameConfig):
         self.player = player
         self.opponent = player.opposite()
+        self.center_col = (config.cols + 1) // 2
     
     def get_move(self, board: GameBoard) -> Optional[int]:
         """Get AI move using simple strategy"""
@@ -38,16 +40,9 @@ class AIPlayer:
     
     def _find_winning_move(self, board: GameBoard, player: Player) -> Optional[int]:
         """Find a move that wins the game immediately"""
-        valid_moves = board.get_valid_moves()
-        
-        for move in valid_moves:
-            board.make_move(move, player)
-            
-            if board.check_winner() != GameState.PLAYING:
-                board.undo_last_move()
+        for move in board.get_valid_moves():
+            if board.is_winning_move(move, player):
                 return move
-            
-            board.undo_last_move()
         
         return None
     
@@ -56,10 +51,10 @@ class AIPlayer:
         if not valid_moves:
             return None
         
-        center_col = (max(valid_moves) + min(valid_moves)) // 2
-        sorted_moves = sorted(valid_moves, key=lambda x: abs(x - center_col))
-        
-        return sorted_moves[0]
+        return min(valid_moves, key=lambda x: abs(x - self.center_col))
+    
+    def reset(self) -> None:
+        """Prepare for a new game; the basic strategy keeps no per-game state"""
     
     def get_player_symbol(self) -> str:
         """Get player symbol"""
@@ -70,6 +65,6 @@ class AIPlayerFactory:
     """Factory for creating AI players"""
     
     @staticmethod
-    def create_ai_player() -> AIPlayer:
+    def create_ai_player(config: GameConfig) -> AIPlayer:
         """Create AI player (always YELLOW in single-player mode)"""
-        return AIPlayer(Player.YELLOW) 
\ No newline at end of file
+        return AIPlayer(Player.YELLOW, config) 
\ No newline at end of file
@@ -1,78 +1,229 @@
-from typing import List, Optional, Tuple
+import random
+from array import array
+from typing import Dict, List, Optional, Tuple
 
 from rich.align import Align
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 
 from config import GameConfig
 from src.enums import Direction, GameState, MoveResult, Player, Position
 
+# (row, col) deltas of every winning line direction, mirroring Direction
+_DIRECTIONS = tuple(direction.value for direction in Direction)
+
+# Shared by every board, so creating one doesn't probe the terminal again
+_CONSOLE = Console()
+
+# Rich markup for each cell, so display() only has to join strings
+_CELL_MARKUP = {
+    Player.RED: "[bold red]🔴[/]",
+    Player.YELLOW: "[bold yellow]🟡[/]",
+    Player.EMPTY: "[dim]⚪[/]",
+}
+
+# Zobrist keys for each board size, indexed by [player][row * cols + col]
+_ZOBRIST_TABLES: Dict[Tuple[int, int], List[List[int]]] = {}
+
+
+def _zobrist_table(rows: int, cols: int) -> List[List[int]]:
+    """Get the Zobrist keys for a board size, seeded so equal boards hash equally"""
+    table = _ZOBRIST_TABLES.get((rows, cols))
+    if table is None:
+        rng = random.Random(0)
+        table = [[rng.getrandbits(64) for _ in range(rows * cols)] for _ in Player]
+        _ZOBRIST_TABLES[(rows, cols)] = table
+    return table
+
 
 class GameBoard:
     """Handles board state and operations"""
 
     def __init__(self, config: GameConfig):
         self.config = config
-        self.board = [
-            [Player.EMPTY for _ in range(config.cols)] for _ in range(config.rows)
+        # Plain ints for the hot paths below, instead of going through config
+        self._rows = config.rows
+        self._cols = config.cols
+        self._win_length = config.win_length
+        self._column_bits = config.rows + 1
+        # Column-major bitboards with one sentinel bit on top of every column,
+        # so bit index is col * (rows + 1) + height
+        self.red_bb = 0
+        self.yellow_bb = 0
+        self._empty_heights = (0,) * config.cols
+        self.heights: List[int] = list(self._empty_heights)
+        self._open_cols_mask = (1 << config.cols) - 1  # Bit per non-full column
+        # (1-based column, open-column bit) pairs for get_valid_moves
+        self._column_masks = tuple((col + 1, 1 << col) for col in range(config.cols))
+        # Bit distance between neighbouring cells along each of _DIRECTIONS
+        self._shifts = tuple(
+            abs(delta_col * self._column_bits - delta_row)
+            for delta_row, delta_col in _DIRECTIONS
+        )
+        self._has_win = (
+            self._has_win_4 if config.win_length == 4 else self._has_win_generic
+        )
+        self._winner: Optional[Player] = None  # Updated as moves are made
+        self._zobrist = _zobrist_table(config.rows, config.cols)
+        self.zobrist_hash = 0
+        self.console = _CONSOLE
+        # Column numbers, padded to the two-cell width of the symbols below
+        self._header_markup = (
+            "[bold blue]"
+            + " ".join(f"{col:^2}" for col in range(1, config.cols + 1))
+            + "[/]"
+        )
+        # One uint16 per move: col | player << 4 | row << 8
+        self._history = array("H")
+
+    @property
+    def move_history(self) -> List[Tuple[Position, Player]]:
+        """
+        Moves made so far as (position, player), decoded from the history.
+
+        Each access builds a new list, so it is a snapshot that does not follow
+        later moves or resets. Use move_count to just count moves.
+        """
+        return [
+            (Position.get(move >> 8, move & 0xF), Player(move >> 4 & 0xF))
+            for move in self._history
         ]
-        self.console = Console()
-        self.move_history: List[Tuple[Position, Player]] = []  # (position, player)
+
+    @property
+    def move_count(self) -> int:
+        """Number of moves made so far, without decoding the history"""
+        return len(self._history)
+
+    @property
+    def board(self) -> List[List[Player]]:
+        """Board state as a grid of players, rebuilt from the bitboards"""
+        rows = self._rows
+        column_bits = self._column_bits
+        grid = [[Player.EMPTY] * self._cols for _ in range(rows)]
+        for col, height in enumerate(self.heights):
+            for cell in range(height):
+                bit = 1 << (col * column_bits + cell)
+                grid[rows - 1 - cell][col] = (
+                    Player.RED if self.red_bb & bit else Player.YELLOW
+                )
+        return grid
 
     def display(self) -> None:
         """Display the current board state"""
-        table = Table(show_header=True, header_style="bold blue")
-
-        for col in range(1, self.config.cols + 1):
-            table.add_column(str(col), justify="center", style="cyan", width=3)
-
-        for row in range(self.config.rows):
-            row_data = []
-            for col in range(self.config.cols):
-                cell = self.board[row][col]
-                if cell == Player.EMPTY:
-                    row_data.append("⚪")
-                else:
-                    row_data.append(cell.symbol)
-            table.add_row(*row_data)
+        lines = [self._header_markup]
+        for board_row in self.board:
+            lines.append(" ".join(_CELL_MARKUP[cell] for cell in board_row))
 
         self.console.print()
-        self.console.print(Align.center(table))
+        self.console.print(Align.center(Text.from_markup("\n".join(lines))))
         self.console.print()
 
     def is_valid_move(self, col: int) -> bool:
         """Check if a move is valid"""
         col_idx = col - 1
 
-        if col_idx < 0 or col_idx >= self.config.cols:
+        if col_idx < 0 or col_idx >= self._cols:
             return False
 
-        return self.board[0][col_idx] == Player.EMPTY
+        return self.heights[col_idx] < self._rows
 
     def make_move(self, col: int, player: Player) -> MoveResult:
         """Make a move on the board"""
         col_idx = col - 1
 
         if not self.is_valid_move(col):
-            if col_idx < 0 or col_idx >= self.config.cols:
+            if col_idx < 0 or col_idx >= self._cols:
                 return MoveResult.INVALID_COLUMN
             else:
                 return MoveResult.COLUMN_FULL
 
-        for row in range(self.config.rows - 1, -1, -1):
-            if self.board[row][col_idx] == Player.EMPTY:
-                self.board[row][col_idx] = player
-                position = Position(row, col_idx)
-                self.move_history.append((position, player))
-                return MoveResult.SUCCESS
+        row = self._drop(col_idx, player)
+        self._history.append(col_idx | player << 4 | row << 8)
+        return MoveResult.SUCCESS
+
+    def make_move_fast(self, col: int, player: Player) -> int:
+        """
+        Make a move without recording it in the move history.
+
+        Meant for search code that undoes its own moves with undo_move_fast.
+
+        Returns:
+            int: Row the piece landed in, or -1 if the move is invalid
+        """
+        if not self.is_valid_move(col):
+            return -1
+
+        return self._drop(col - 1, player)
+
+    def undo_move_fast(self, col: int) -> bool:
+        """
+        Remove the top piece of a column placed with make_move_fast.
+
+        Returns:
+            bool: False, leaving the board untouched, if the column is invalid
+            or empty
+        """
+        col_idx = col - 1
+        if col_idx < 0 or col_idx >= self._cols or self.heights[col_idx] == 0:
+            return False
+
+        height = self.heights[col_idx] - 1
+        bit = 1 << (col_idx * self._column_bits + height)
+        if self.red_bb & bit:
+            self.red_bb ^= bit
+            player = Player.RED
+        else:
+            self.yellow_bb ^= bit
+            player = Player.YELLOW
+        self.heights[col_idx] = height
+        cell = (self._rows - 1 - height) * self._cols + col_idx
+        self.zobrist_hash ^= self._zobrist[player][cell]
+        self._open_cols_mask |= 1 << col_idx
+
+        if self._winner is not None:
+            self._winner = self._find_winner_on_board()
+        return True
+
+    def _drop(self, col_idx: int, player: Player) -> int:
+        """Drop a piece into a column known to have room, returning its row"""
+        height = self.heights[col_idx]
+        bit = 1 << (col_idx * self._column_bits + height)
+        if player == Player.RED:
+            self.red_bb |= bit
+            bitboard = self.red_bb
+        else:
+            self.yellow_bb |= bit
+            bitboard = self.yellow_bb
+        self.heights[col_idx] = height + 1
+        if height + 1 == self._rows:
+            self._open_cols_mask &= ~(1 << col_idx)
+
+        # Only a line through the new piece can be a new win
+        if self._winner is None and self._has_win(bitboard):
+            self._winner = player
+
+        row = self._rows - 1 - height
+        self.zobrist_hash ^= self._zobrist[player][row * self._cols + col_idx]
+        return row
+
+    def is_winning_move(self, col: int, player: Player) -> bool:
+        """Check if a move would win the game, without making it"""
+        if not self.is_valid_move(col):
+            return False
+
+        col_idx = col - 1
+        bit = 1 << (col_idx * self._column_bits + self.heights[col_idx])
+        bitboard = self.red_bb if player == Player.RED else self.yellow_bb
+        return self._has_win(bitboard | bit)
 
-        return MoveResult.COLUMN_FULL
+    def position_key(self) -> int:
+        """Get a hash of the current position, for transposition tables"""
+        return self.zobrist_hash
 
     def check_winner(self) -> GameState:
         """Check if there's a winner or draw"""
-        winner = self._find_winner_on_board()
-        if winner:
-            return self._player_to_game_state(winner)
+        if self._winner is not None:
+            return self._player_to_game_state(self._winner)
 
         if self.is_full():
             return GameState.DRAW
@@ -80,29 +231,43 @@ class GameBoard:
         return GameState.PLAYING
 
     def _find_winner_on_board(self) -> Optional[Player]:
-        """Scan the entire board to find a winning player"""
-        for row in range(self.config.rows):
-            for col in range(self.config.cols):
-                position = Position(row, col)
-                if self._is_occupied_position(position):
-                    winner = self._check_all_directions_from_position(position)
-                    if winner:
-                        return winner
+        """Check both bitboards for a winning line"""
+        if self._has_win(self.red_bb):
+            return Player.RED
+        if self._has_win(self.yellow_bb):
+            return Player.YELLOW
         return None
 
-    def _is_occupied_position(self, position: Position) -> bool:
-        """Check if a board position is occupied by a player"""
-        return self.board[position.row][position.col] != Player.EMPTY
-
-    def _check_all_directions_from_position(
-        self, position: Position
-    ) -> Optional[Player]:
-        """Check all possible winning directions from a given position"""
-        for direction in Direction:
-            winner = self._check_line(position, direction)
-            if winner and winner != Player.EMPTY:
-                return winner
-        return None
+    def _has_win_4(self, bitboard: int) -> bool:
+        """Check a player's bitboard for 4 pieces in a line, the classic rule"""
+        horizontal, vertical, diagonal_right, diagonal_left = self._shifts
+        line = bitboard & (bitboard >> horizontal)
+        if line & (line >> 2 * horizontal):
+            return True
+        line = bitboard & (bitboard >> vertical)
+        if line & (line >> 2 * vertical):
+            return True
+        line = bitboard & (bitboard >> diagonal_right)
+        if line & (line >> 2 * diagonal_right):
+            return True
+        line = bitboard & (bitboard >> diagonal_left)
+        return bool(line & (line >> 2 * diagonal_left))
+
+    def _has_win_generic(self, bitboard: int) -> bool:
+        """Check a player's bitboard for win_length pieces in a line"""
+        win_length = self._win_length
+        for shift in self._shifts:
+            # Double the run length each step, then top up to win_length
+            line = bitboard
+            length = 1
+            while length * 2 <= win_length:
+                line &= line >> (shift * length)
+                length *= 2
+            if length < win_length:
+                line &= line >> (shift * (win_length - length))
+            if line:
+                return True
+        return False
 
     def _player_to_game_state(self, player: Player) -> GameState:
         """Convert a winning player to the corresponding game state"""
@@ -112,75 +277,44 @@ class GameBoard:
         }
         return player_to_state.get(player, GameState.PLAYING)
 
-    def _check_line(
-        self, start_position: Position, direction: Direction
-    ) -> Optional[Player]:
-        """Helper method to check a line for winner"""
-        player = self.board[start_position.row][start_position.col]
-
-        if player == Player.EMPTY:
-            return None
-
-        count = 1
-
-        # Check in both directions
-        for direction_multiplier in [1, -1]:
-            current_pos = start_position.move_by_direction(
-                direction, direction_multiplier
-            )
-
-            while (
-                current_pos.is_valid(self.config.rows, self.config.cols)
-                and self.board[current_pos.row][current_pos.col] == player
-            ):
-                count += 1
-                current_pos = current_pos.move_by_direction(
-                    direction, direction_multiplier
-                )
-
-        return player if count >= self.config.win_length else None
-
     def is_full(self) -> bool:
         """Check if board is full"""
-        return all(
-            self.board[0][col] != Player.EMPTY for col in range(self.config.cols)
-        )
+        return self._open_cols_mask == 0
 
     def get_valid_moves(self) -> List[int]:
         """Get list of valid column numbers (1-based)"""
-        return [
-            col + 1 for col in range(self.config.cols) if self.is_valid_move(col + 1)
-        ]
+        open_cols = self._open_cols_mask
+        return [col for col, mask in self._column_masks if open_cols & mask]
 
     def reset(self) -> None:
         """Reset the board to initial state"""
-        self.board = [
-            [Player.EMPTY for _ in range(self.config.cols)]
-            for _ in range(self.config.rows)
-        ]
-        self.move_history.clear()
+        self.red_bb = 0
+        self.yellow_bb = 0
+        # Refill in place so references to heights stay valid across games
+        self.heights[:] = self._empty_heights
+        self._open_cols_mask = (1 << self._cols) - 1
+        self._winner = None
+        self.zobrist_hash = 0
+        del self._history[:]
 
     def get_board_copy(self) -> List[List[Player]]:
         """Get a copy of the current board state"""
-        return [row[:] for row in self.board]
+        # The board property already builds a fresh grid on every access
+        return self.board
 
     def undo_last_move(self) -> bool:
         """Undo the last move"""
-        if not self.move_history:
+        if not self._history:
             return False
 
-        position, player = self.move_history.pop()
-        self.board[position.row][position.col] = Player.EMPTY
+        move = self._history.pop()
+        self.undo_move_fast((move & 0xF) + 1)
         return True
 
     def get_column_height(self, col: int) -> int:
         """Get the number of pieces in a column (1-based column number)"""
         col_idx = col - 1
-        if col_idx < 0 or col_idx >= self.config.cols:
+        if col_idx < 0 or col_idx >= self._cols:
             return 0
 
-        count = 0
-        for row in range(self.config.rows):
-            if self.board[row][col_idx] != Player.EMPTY:
-                count += 1
-        return count
+        return self.heights[col_idx]
@@ -1,3 +1,4 @@
+import sys
 import time
 
 from rich.align import Align
@@ -5,7 +6,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-from config import GameConfig
+from config import DEFAULT_CONFIG, GameConfig
 from src.ai_player import AIPlayerFactory
 from src.board import GameBoard
 from src.consts import (
@@ -28,15 +29,22 @@ from src.consts import (
 from src.enums import GameState, MoveResult, Player
 from src.input_handler import InputHandler
 
+_CONSOLE = Console()
+
 
 class GameEngine:
     """Main game engine orchestrating the game flow"""
 
     def __init__(self, config: GameConfig = None):
-        self.config = config or GameConfig()
+        self.config = config or DEFAULT_CONFIG
+        self.animate = (
+            self.config.animate
+            if self.config.animate is not None
+            else sys.stdout.isatty()
+        )
         self.board = GameBoard(self.config)
         self.input_handler = InputHandler()
-        self.console = Console()
+        self.console = _CONSOLE
         self.current_player = Player.RED
         self.game_state = GameState.PLAYING
         self.ai_player = None
@@ -104,7 +112,8 @@ class GameEngine:
         self.console.print(f"\n{AI_THINKING}", end="")
 
         for _ in range(3):
-            time.sleep(0.5)
+            if self.animate:
+                time.sleep(0.5)
             self.console.print(".", end="")
 
         ai_move = self.ai_player.get_move(self.board)
@@ -114,7 +123,8 @@ class GameEngine:
 
             if result == MoveResult.SUCCESS:
                 self.console.print(f"\n{AI_MOVE.format(ai_move)}", style="bold yellow")
-                time.sleep(1)
+                if self.animate:
+                    time.sleep(1)
             else:
                 valid_moves = self.board.get_valid_moves()
                 if valid_moves:
@@ -150,7 +160,7 @@ class GameEngine:
 
         if game_mode == "one_player":
             self.is_single_player = True
-            self.ai_player = AIPlayerFactory.create_ai_player()
+            self.ai_player = AIPlayerFactory.create_ai_player(self.config)
 
             self.console.print(f"\n{SETUP_SINGLE_PLAYER}", style="bold green")
 
@@ -210,6 +220,8 @@ class GameEngine:
     def reset_game(self) -> None:
         """Reset game for new round"""
         self.board.reset()
+        if self.ai_player:
+            self.ai_player.reset()
         self.current_player = Player.RED
         self.game_state = GameState.PLAYING
 
@@ -219,7 +231,7 @@ class GameEngine:
             "board_size": f"{self.config.rows}x{self.config.cols}",
             "win_length": self.config.win_length,
             "current_player": self.current_player.name_str,
-            "game_state": self.game_state.value,
-            "moves_made": len(self.board.move_history),
+            "game_state": self.game_state.name.lower(),
+            "moves_made": self.board.move_count,
             "valid_moves": self.board.get_valid_moves(),
         }
@@ -1,46 +1,50 @@
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import ClassVar, Dict, Tuple
 
+# Symbol for each Player value (RED, YELLOW, EMPTY)
+_PLAYER_SYMBOLS = {1: "🔴", 2: "🟡", 0: "⚪"}
 
-class Player(Enum):
-    """Player enumeration for type safety"""
 
-    RED = "🔴"
-    YELLOW = "🟡"
-    EMPTY = "⚪"
+class Player(IntEnum):
+    """Player enumeration for type safety, backed by ints for cheap comparison"""
 
-    @property
-    def symbol(self) -> str:
-        """Get the symbol representation"""
-        return self.value
+    RED = 1
+    YELLOW = 2
+    EMPTY = 0
 
-    @property
-    def name_str(self) -> str:
-        """Get the string name"""
-        return self.name.lower()
+    # Set once per member in __init__ rather than computed by properties
+    symbol: str  # Symbol representation
+    name_str: str  # Lowercase name
+
+    def __init__(self, value: int) -> None:
+        self.symbol = _PLAYER_SYMBOLS[value]
+        self.name_str = self.name.lower()
 
     def opposite(self) -> "Player":
         """Get the opposite player"""
-        if self == Player.RED:
-            return Player.YELLOW
-        elif self == Player.YELLOW:
-            return Player.RED
-        else:
-            return Player.EMPTY
+        return PLAYER_OPPOSITES[self]
+
+
+PLAYER_OPPOSITES = {
+    Player.RED: Player.YELLOW,
+    Player.YELLOW: Player.RED,
+    Player.EMPTY: Player.EMPTY,
+}
+
 
+class GameState(IntEnum):
+    """Game state enumeration, backed by ints for cheap comparison and hashing"""
 
-class GameState(Enum):
-    """Game state enumeration"""
+    PLAYING = 0
+    RED_WINS = 1
+    YELLOW_WINS = 2
+    DRAW = 3
 
-    PLAYING = "playing"
-    RED_WINS = "red_wins"
-    YELLOW_WINS = "yellow_wins"
-    DRAW = "draw"
+    is_game_over: bool  # Whether the game has ended
 
-    @property
-    def is_game_over(self) -> bool:
-        """Check if the game is over"""
-        return self != GameState.PLAYING
+    def __init__(self, value: int) -> None:
+        self.is_game_over = self.name != "PLAYING"
 
 
 class Direction(Enum):
@@ -51,15 +55,12 @@ class Direction(Enum):
     DIAGONAL_RIGHT = (1, 1)
     DIAGONAL_LEFT = (1, -1)
 
-    @property
-    def delta_row(self) -> int:
-        """Get row delta for this direction"""
-        return self.value[0]
+    delta_row: int  # Row delta for this direction
+    delta_col: int  # Column delta for this direction
 
-    @property
-    def delta_col(self) -> int:
-        """Get column delta for this direction"""
-        return self.value[1]
+    def __init__(self, delta_row: int, delta_col: int) -> None:
+        self.delta_row = delta_row
+        self.delta_col = delta_col
 
 
 class MoveResult(Enum):
@@ -71,24 +72,35 @@ class MoveResult(Enum):
     GAME_OVER = "game_over"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     """Represents a position on the board"""
 
     row: int
     col: int
 
+    # Shared instances for every on-board cell, filled in below the class
+    _POOL: ClassVar[Dict[Tuple[int, int], "Position"]] = {}
+
+    @classmethod
+    def get(cls, row: int, col: int) -> "Position":
+        """Get the shared instance for a board cell, or a new one off the board"""
+        position = cls._POOL.get((row, col))
+        if position is None:
+            return cls(row, col)
+        return position
+
     def is_valid(self, max_rows: int, max_cols: int) -> bool:
         """Check if position is valid for given board dimensions"""
         return 0 <= self.row < max_rows and 0 <= self.col < max_cols
 
     def move_by(self, delta_row: int, delta_col: int) -> "Position":
         """Create a new position moved by the given deltas"""
-        return Position(self.row + delta_row, self.col + delta_col)
+        return Position.get(self.row + delta_row, self.col + delta_col)
 
     def move_by_direction(self, direction: Direction, steps: int = 1) -> "Position":
         """Create a new position moved by the given direction and steps"""
-        return Position(
+        return Position.get(
             self.row + direction.delta_row * steps,
             self.col + direction.delta_col * steps,
         )
@@ -96,3 +108,12 @@ class Position:
     def __str__(self) -> str:
         """String representation of position"""
         return f"Position(row={self.row}, col={self.col})"
+
+
+# Covers the largest board GameConfig allows (10x10)
+_MAX_BOARD_SIZE = 10
+Position._POOL.update(
+    ((row, col), Position(row, col))
+    for row in range(_MAX_BOARD_SIZE)
+    for col in range(_MAX_BOARD_SIZE)
+)
@@ -1,4 +1,6 @@
 
+import sys
+
 from src.enums import Player
 from rich.console import Console
 from rich.text import Text
@@ -14,19 +16,25 @@ class InputHandler:
     
     def __init__(self):
         self.console = Console()
+        # Scripted sessions read stdin directly instead of through input()
+        self._interactive = sys.stdin.isatty()
+        # Styled player labels, built once instead of on every prompt
+        self._player_labels = {
+            player: Text(f"Player {player.symbol} ({player.name_str.upper()})",
+                         style="bold red" if player == Player.RED else "bold yellow")
+            for player in (Player.RED, Player.YELLOW)
+        }
     
     def get_column_input(self, current_player: Player, max_cols: int) -> int:
         """Get and validate column input from user"""
+        prompt = (self._player_labels[current_player]
+                  + f", enter column (1-{max_cols}): ")
+        
         while True:
             try:
-                player_text = Text()
-                player_text.append(f"Player {current_player.symbol} ({current_player.name_str.upper()})", 
-                                 style="bold red" if current_player == Player.RED else "bold yellow")
-                
-                self.console.print(player_text, end="")
-                self.console.print(f", enter column (1-{max_cols}): ", end="")
+                self.console.print(prompt, end="")
                 
-                user_input = input().strip()
+                user_input = self._read_line().strip()
                 
                 if not user_input:
                     self.console.print(ERROR_ENTER_NUMBER, style="bold red")
@@ -56,7 +64,7 @@ class InputHandler:
         while True:
             try:
                 self.console.print(PROMPT_PLAY_AGAIN, style="bold blue", end="")
-                user_input = input().strip().lower()
+                user_input = self._read_line().strip().lower()
                 
                 if user_input in ['y', 'yes', '1', 'true']:
                     return True
@@ -73,6 +81,16 @@ class InputHandler:
                 self.console.print("\n❌ End of input reached!", style="bold red")
                 return False
     
+    def _read_line(self) -> str:
+        """Read a line of user input, raising EOFError at end of input"""
+        if self._interactive:
+            return input()
+        
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line
+    
     def display_message(self, message: str, style: str = "bold white") -> None:
         """Display a message with styling"""
         self.console.print(message, style=style)
@@ -97,7 +115,7 @@ class InputHandler:
         """Wait for user to press Enter"""
         try:
             self.console.print(f"\n{message}", style="dim")
-            input()
+            self._read_line()
         except KeyboardInterrupt:
             pass
     
@@ -107,7 +125,7 @@ class InputHandler:
             try:
                 self.console.print(GAME_MODE_PROMPT, end="")
                 
-                user_input = input().strip()
+                user_input = self._read_line().strip()
                 
                 if user_input == "1":
                     return "two_player"
@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import pytest
+
+from config import GameConfig
+from src.ai_player import AIPlayer, AIPlayerFactory
+from src.board import GameBoard
+from src.enums import Player
+
+
+class TestAIPlayer:
+    """Test suite for AIPlayer class"""
+
+    @pytest.fixture
+    def config(self):
+        """Default configuration for testing"""
+        return GameConfig(rows=6, cols=7, win_length=4)
+
+    @pytest.fixture
+    def board(self, config):
+        """Default board instance"""
+        return GameBoard(config)
+
+    @pytest.fixture
+    def ai_player(self, config):
+        """AI player without its random moves"""
+        with patch("src.ai_player.random.random", return_value=1.0):
+            yield AIPlayerFactory.create_ai_player(config)
+
+    def test_factory_creates_yellow_player(self, config):
+        """Test the factory creates the single-player opponent"""
+        ai_player = AIPlayerFactory.create_ai_player(config)
+        assert isinstance(ai_player, AIPlayer)
+        assert ai_player.player == Player.YELLOW
+        assert ai_player.opponent == Player.RED
+
+    def test_takes_winning_move(self, ai_player, board):
+        """Test the AI completes its own line before blocking the opponent"""
+        for col in range(1, 4):
+            board.make_move(col, Player.YELLOW)
+        for _ in range(3):
+            board.make_move(7, Player.RED)
+
+        assert ai_player.get_move(board) == 4
+
+    def test_blocks_opponent_win(self, ai_player, board):
+        """Test the AI blocks a line the opponent is about to complete"""
+        for _ in range(3):
+            board.make_move(7, Player.RED)
+
+        assert ai_player.get_move(board) == 7
+
+    def test_prefers_center_column(self, ai_player, board):
+        """Test the AI plays the center column without threats"""
+        assert ai_player.get_move(board) == 4
+
+        for row in range(6):
+            board.make_move(4, Player.RED if row % 2 else Player.YELLOW)
+        assert ai_player.get_move(board) in (3, 5)
+
+    def test_no_valid_moves(self, ai_player, board):
+        """Test the AI has no move on a full board"""
+        for col in range(1, 8):
+            for row in range(6):
+                board.make_move_fast(col, Player.RED if row % 2 else Player.YELLOW)
+
+        assert ai_player.get_move(board) is None
+
+    def test_reset_between_games(self, ai_player, board):
+        """Test the AI plays a fresh game the same way after reset"""
+        for _ in range(3):
+            board.make_move(7, Player.RED)
+        assert ai_player.get_move(board) == 7
+
+        board.reset()
+        ai_player.reset()
+
+        assert ai_player.get_move(board) == 4
@@ -165,6 +165,36 @@ class TestGameBoard:
 
         assert board.check_winner() == GameState.RED_WINS
 
+    def test_check_winner_no_wrap_between_columns(self, board):
+        """Test that lines do not wrap from the top of one column to the next"""
+        # Top of column 1 followed by the bottom three cells of column 2
+        for player in [
+            Player.YELLOW,
+            Player.YELLOW,
+            Player.RED,
+            Player.YELLOW,
+            Player.YELLOW,
+            Player.RED,
+        ]:
+            board.make_move(1, player)
+        for _ in range(3):
+            board.make_move(2, Player.RED)
+
+        assert board.check_winner() == GameState.PLAYING
+
+    def test_is_winning_move(self, board):
+        """Test winning move detection leaves the board untouched"""
+        for col in range(1, 4):
+            board.make_move(col, Player.RED)
+
+        assert board.is_winning_move(4, Player.RED) is True
+        assert board.is_winning_move(4, Player.YELLOW) is False
+        assert board.is_winning_move(5, Player.RED) is False
+        assert board.is_winning_move(0, Player.RED) is False
+        assert board.get_column_height(4) == 0
+        assert len(board.move_history) == 3
+        assert board.check_winner() == GameState.PLAYING
+
     def test_check_winner_no_winner(self, board):
         """Test no winner state"""
         # Make some moves but no win
@@ -245,6 +275,8 @@ class TestGameBoard:
 
     def test_reset(self, board):
         """Test board reset"""
+        heights = board.heights
+
         # Make some moves
         board.make_move(1, Player.RED)
         board.make_move(2, Player.YELLOW)
@@ -255,6 +287,10 @@ class TestGameBoard:
         # Check everything is cleared
         assert all(cell == Player.EMPTY for row in board.board for cell in row)
         assert board.move_history == []
+        assert board.get_valid_moves() == [1, 2, 3, 4, 5, 6, 7]
+
+        # State containers are reused rather than replaced
+        assert board.heights is heights
 
     def test_get_board_copy(self, board):
         """Test get_board_copy"""
@@ -274,12 +310,72 @@ class TestGameBoard:
         board.make_move(1, Player.RED)
         assert board.board[5][0] == Player.RED
         assert len(board.move_history) == 1
+        assert board.move_count == 1
 
         # Undo move
+        history = board.move_history
         success = board.undo_last_move()
         assert success is True
         assert board.board[5][0] == Player.EMPTY
         assert len(board.move_history) == 0
+        assert board.move_count == 0
+
+        # Earlier move_history results are snapshots
+        assert len(history) == 1
+
+    def test_undo_winning_move(self, board):
+        """Test undoing the winning move resumes play"""
+        for col in range(1, 5):
+            board.make_move(col, Player.RED)
+        assert board.check_winner() == GameState.RED_WINS
+
+        board.undo_last_move()
+        assert board.check_winner() == GameState.PLAYING
+
+    def test_make_and_undo_move_fast(self, small_board):
+        """Test history-free moves used by search code"""
+        for _ in range(3):
+            assert small_board.make_move_fast(1, Player.YELLOW) != -1
+        assert small_board.check_winner() == GameState.YELLOW_WINS
+        assert small_board.make_move_fast(1, Player.RED) == 0
+        assert small_board.make_move_fast(1, Player.RED) == -1
+        assert small_board.make_move_fast(5, Player.RED) == -1
+        assert small_board.move_history == []
+
+        assert small_board.undo_move_fast(1)
+        assert small_board.undo_move_fast(1)
+        assert small_board.get_column_height(1) == 2
+        assert small_board.check_winner() == GameState.PLAYING
+
+        # Empty or invalid columns are rejected without touching the board
+        bitboards = (small_board.red_bb, small_board.yellow_bb)
+        for col in (0, 2, 5):
+            assert not small_board.undo_move_fast(col)
+        assert (small_board.red_bb, small_board.yellow_bb) == bitboards
+        assert small_board.get_column_height(2) == 0
+        assert small_board.make_move(2, Player.RED) == MoveResult.SUCCESS
+        assert small_board.get_column_height(2) == 1
+
+    def test_zobrist_hash(self, board, default_config):
+        """Test position hashes depend only on the pieces on the board"""
+        assert board.zobrist_hash == 0
+
+        board.make_move(1, Player.RED)
+        board.make_move(2, Player.YELLOW)
+        board.make_move(3, Player.RED)
+        other = GameBoard(default_config)
+        other.make_move(3, Player.RED)
+        other.make_move(2, Player.YELLOW)
+        other.make_move(1, Player.RED)
+        assert board.position_key() == other.position_key() != 0
+
+        board.undo_last_move()
+        board.make_move(3, Player.YELLOW)
+        assert board.position_key() != other.position_key()
+
+        for _ in range(3):
+            board.undo_last_move()
+        assert board.zobrist_hash == 0
 
     def test_undo_last_move_empty_history(self, board):
         """Test undo when no moves made"""
@@ -439,6 +535,22 @@ class TestEnums:
         assert pos1 != pos3
         assert pos2 != pos3
 
+    def test_position_get_shared(self):
+        """Test Position.get returns one shared instance per coordinate"""
+        pos = Position.get(2, 3)
+        assert pos == Position(2, 3)
+        assert Position.get(2, 3) is pos
+        assert Position.get(1, 4).move_by(1, -1) is pos
+
+    def test_position_get_off_board_not_pooled(self):
+        """Test off-board positions are built fresh instead of pooled"""
+        pool_size = len(Position._POOL)
+        pos = Position(0, 0).move_by(-1, -1000)
+
+        assert pos == Position(-1, -1000)
+        assert Position.get(-1, -1000) is not pos
+        assert len(Position._POOL) == pool_size
+
     def test_position_immutability(self):
         """Test that Position is immutable (frozen dataclass)"""
         pos = Position(2, 3)
@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from config import (
+    DEFAULT_CONFIG,
+    GameConfig,
+    compiled_config_path,
+    get_config,
+    load_compiled_config,
+    load_config_from_yaml,
+)
+from tools.compile_config import compile_config
+
+
+class TestConfig:
+    """Test suite for configuration loading"""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """Small YAML configuration file"""
+        path = tmp_path / "config.yaml"
+        path.write_text("rows: 5\ncols: 6\nwin_length: 4\n", encoding="utf-8")
+        return path
+
+    def test_from_trusted_defaults(self):
+        """Test from_trusted fills in field defaults"""
+        assert GameConfig.from_trusted() == GameConfig()
+        assert GameConfig.from_trusted({"rows": 5}) == GameConfig(rows=5)
+
+    def test_get_config_defaults(self):
+        """Test get_config without a path returns the shared default"""
+        assert get_config() is DEFAULT_CONFIG
+        assert get_config() == GameConfig()
+
+    def test_get_config_from_yaml_is_cached(self, config_file):
+        """Test get_config loads a YAML file once per path"""
+        config = get_config(config_file)
+        assert config == GameConfig(rows=5, cols=6, win_length=4)
+        assert get_config(str(config_file)) is config
+
+    def test_load_large_yaml(self, tmp_path):
+        """Test loading a YAML file big enough to be memory-mapped"""
+        path = tmp_path / "large.yaml"
+        padding = "# padding comment\n" * 100
+        path.write_text(f"{padding}rows: 8\ncols: 9\n", encoding="utf-8")
+
+        assert load_config_from_yaml(path) == GameConfig(rows=8, cols=9)
+
+    def test_compiled_config(self, config_file):
+        """Test compiled configuration matches the YAML it was built from"""
+        output_path = compile_config(config_file)
+
+        assert output_path == compiled_config_path(config_file)
+        assert load_compiled_config(config_file) == GameConfig(
+            rows=5, cols=6, win_length=4
+        )
+
+    def test_compiled_config_stale(self, config_file):
+        """Test compiled configuration is ignored once the YAML is newer"""
+        output_path = compile_config(config_file)
+        yaml_mtime = os.stat(config_file).st_mtime
+        os.utime(output_path, (yaml_mtime - 10, yaml_mtime - 10))
+
+        assert load_compiled_config(config_file) is None
+
+    def test_compiled_config_missing(self, config_file):
+        """Test loading a compiled configuration that was never generated"""
+        assert load_compiled_config(config_file) is None
+
+    def test_compiled_config_recompiled(self, config_file):
+        """Test recompiling within the same second picks up the new values"""
+        compile_config(config_file)
+        assert load_compiled_config(config_file).rows == 5
+
+        config_file.write_text("rows: 6\ncols: 6\nwin_length: 4\n", encoding="utf-8")
+        compile_config(config_file)
+
+        assert load_compiled_config(config_file).rows == 6
+        assert not (config_file.parent / "__pycache__").exists()
+
+    def test_compiled_config_invalid_falls_back(self, config_file):
+        """Test a broken compiled file falls back to the YAML config"""
+        compiled_config_path(config_file).write_text(
+            "import os\nCONFIG = {}\n", encoding="utf-8"
+        )
+
+        assert load_compiled_config(config_file) is None
+        assert get_config(config_file) == GameConfig(rows=5, cols=6, win_length=4)
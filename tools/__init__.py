@@ -0,0 +1 @@
+"""Connect 4 game tools"""
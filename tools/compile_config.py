@@ -0,0 +1,68 @@
+"""
+Connect 4 Game - Config Compiler
+Turns a YAML config into a Python literal that get_config() loads without
+parsing YAML or re-running validation
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import compiled_config_path, load_config_from_yaml  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+COMPILED_TEMPLATE = (
+    "# Generated by tools/compile_config.py from {source} - do not edit\n"
+    "# Read back with ast.literal_eval, so it must stay a single literal\n"
+    "{data!r}\n"
+)
+
+
+def compile_config(config_path: Path) -> Path:
+    """Validate a YAML config and write its compiled form next to it"""
+    config = load_config_from_yaml(config_path)
+    output_path = compiled_config_path(config_path)
+    output_path.write_text(
+        COMPILED_TEMPLATE.format(source=config_path.name, data=config.model_dump()),
+        encoding="utf-8",
+    )
+    return output_path
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Compile a Connect 4 YAML config into a Python literal"
+    )
+
+    parser.add_argument(
+        "--config",
+        "-c",
+        type=str,
+        default="config.yaml",
+        help="Path to YAML configuration file",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point"""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    args = parse_arguments()
+
+    try:
+        output_path = compile_config(Path(args.config))
+    except Exception as e:
+        logger.error(f"Error compiling configuration: {e}")
+        sys.exit(1)
+
+    logger.info(f"Compiled configuration written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()